@@ -0,0 +1,244 @@
+"""
+Capture sources and capture regions for the recorder.
+
+A capture source knows how to grab pixels from a desktop and how to look up
+monitor and window rectangles on it. A capture region decides which part of
+that desktop is recorded (the primary monitor, one monitor, or a window) and
+translates absolute screen coordinates into coordinates relative to the
+captured area.
+
+All rectangles are (left, top, right, bottom) tuples in virtual desktop
+coordinates, the same convention used by win32 and PIL.
+"""
+
+import ctypes
+import logging
+
+REGION_MODES = ("full", "monitor", "window", "tracked-window")
+
+# Also copy layered windows (menus, tooltips), like PrintScreen does.
+CAPTUREBLT = 0x40000000
+DWMWA_EXTENDED_FRAME_BOUNDS = 9
+
+
+def set_dpi_awareness():
+    """
+    Make the process per-monitor DPI aware, so that window rectangles, monitor
+    rectangles, pynput coordinates and grabbed pixels are all physical pixels.
+    DWM frame bounds are always physical, the other APIs are scaled otherwise.
+    """
+    user32 = ctypes.windll.user32
+    try:
+        # DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2, Windows 10 1703 and later.
+        if user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4)):
+            return
+    except AttributeError:
+        pass
+    try:
+        # PROCESS_PER_MONITOR_DPI_AWARE, Windows 8.1 and later.
+        if ctypes.windll.shcore.SetProcessDpiAwareness(2) == 0:
+            return
+    except (AttributeError, OSError):
+        pass
+    user32.SetProcessDPIAware()
+
+
+def rect_size(rect):
+    return rect[2] - rect[0], rect[3] - rect[1]
+
+
+def rect_contains(rect, x, y):
+    return rect[0] <= x < rect[2] and rect[1] <= y < rect[3]
+
+
+class ScreenCaptureSource:
+    """Grabs pixels and window geometry from the live Windows desktop."""
+
+    def __init__(self):
+        set_dpi_awareness()
+
+    def grab(self, bbox=None):
+        if bbox is None:
+            import pyautogui
+            return pyautogui.screenshot()
+        import win32con
+        import win32gui
+        import win32ui
+        from PIL import Image
+        # BitBlt only the requested rectangle from the screen DC, whose origin is
+        # the primary monitor's top-left, so virtual desktop coordinates work as-is.
+        left, top, right, bottom = bbox
+        width, height = right - left, bottom - top
+        screen_dc = win32gui.GetDC(0)
+        src_dc = win32ui.CreateDCFromHandle(screen_dc)
+        mem_dc = src_dc.CreateCompatibleDC()
+        bitmap = win32ui.CreateBitmap()
+        try:
+            bitmap.CreateCompatibleBitmap(src_dc, width, height)
+            mem_dc.SelectObject(bitmap)
+            mem_dc.BitBlt((0, 0), (width, height), src_dc, (left, top), win32con.SRCCOPY | CAPTUREBLT)
+            bits = bitmap.GetBitmapBits(True)
+        finally:
+            # The bitmap is still selected into mem_dc, so free the DCs before it.
+            mem_dc.DeleteDC()
+            src_dc.DeleteDC()
+            win32gui.ReleaseDC(0, screen_dc)
+            win32gui.DeleteObject(bitmap.GetHandle())
+        return Image.frombuffer("RGB", (width, height), bits, "raw", "BGRX", 0, 1)
+
+    def monitors(self):
+        import win32api
+        monitors = []
+        for handle, _, rect in win32api.EnumDisplayMonitors():
+            is_primary = bool(win32api.GetMonitorInfo(handle).get("Flags", 0) & 1)
+            monitors.append((not is_primary, tuple(rect)))
+        # Primary monitor first, so that monitor 0 matches what the user expects.
+        return [rect for _, rect in sorted(monitors, key=lambda m: m[0])]
+
+    def foreground_window(self):
+        import win32gui
+        hwnd = win32gui.GetForegroundWindow()
+        return hwnd or None
+
+    def window_rect(self, window):
+        import win32gui
+        if not window or not win32gui.IsWindow(window) or win32gui.IsIconic(window):
+            return None
+        # GetWindowRect includes the invisible resize borders on Windows 10/11,
+        # the extended frame bounds are the visible window.
+        from ctypes import wintypes
+        rect = wintypes.RECT()
+        result = ctypes.windll.dwmapi.DwmGetWindowAttribute(
+            wintypes.HWND(window), wintypes.DWORD(DWMWA_EXTENDED_FRAME_BOUNDS),
+            ctypes.byref(rect), ctypes.sizeof(rect))
+        if result == 0:
+            return rect.left, rect.top, rect.right, rect.bottom
+        return tuple(win32gui.GetWindowRect(window))
+
+
+class ImageCaptureSource:
+    """
+    Synthetic desktop backed by a single PIL image.
+
+    Lets capture regions be exercised without a real display. `origin` is the
+    virtual desktop position of the image's top-left pixel, `monitors` and
+    `windows` are rectangles on that desktop, and `foreground` is the key in
+    `windows` that is reported as the active window. Windows can be moved by
+    updating the `windows` dict between grabs. Like pyautogui on Windows, a
+    full grab returns the primary monitor, the first entry of `monitors`.
+    """
+
+    def __init__(self, image, origin=(0, 0), monitors=None, windows=None, foreground=None):
+        self.image = image
+        self.origin = origin
+        left, top = origin
+        self._monitors = monitors or [(left, top, left + image.width, top + image.height)]
+        self.windows = dict(windows or {})
+        self.foreground = foreground
+
+    def grab(self, bbox=None):
+        if bbox is None:
+            bbox = self._monitors[0]
+        left, top = self.origin
+        return self.image.crop((bbox[0] - left, bbox[1] - top, bbox[2] - left, bbox[3] - top))
+
+    def monitors(self):
+        return list(self._monitors)
+
+    def foreground_window(self):
+        return self.foreground
+
+    def window_rect(self, window):
+        return self.windows.get(window)
+
+
+class CaptureRegion:
+    """
+    The part of the desktop that screenshots and the video are taken from.
+
+    Modes:
+        full            the primary monitor, grabbed exactly as before.
+        monitor         one monitor; `monitor` is its index, or None for the
+                        monitor containing the active window.
+        window          the active window's rectangle, fixed at setup time.
+        tracked-window  the active window chosen at setup time, followed as it
+                        moves. The size stays fixed so the video frame size
+                        does not change.
+    """
+
+    def __init__(self, source, mode="full", monitor=None):
+        if mode not in REGION_MODES:
+            raise ValueError(f"Unknown capture region mode: {mode}")
+        self.source = source
+        self.mode = mode
+        self.window = None
+        self._bbox = None
+        if mode == "monitor":
+            self._bbox = self._select_monitor(monitor)
+        elif mode in ("window", "tracked-window"):
+            self.window = source.foreground_window()
+            self._bbox = source.window_rect(self.window)
+            if self._bbox is None:
+                raise ValueError("No active window found to capture.")
+        if self._bbox is not None and min(rect_size(self._bbox)) <= 0:
+            raise ValueError(f"Capture region {self._bbox} is empty.")
+
+    def _select_monitor(self, index):
+        monitors = self.source.monitors()
+        if not monitors:
+            raise ValueError("No monitors found to capture.")
+        if index is not None:
+            if not 0 <= index < len(monitors):
+                raise ValueError(f"Monitor {index} not found, {len(monitors)} monitor(s) available.")
+            return monitors[index]
+        window_rect = self.source.window_rect(self.source.foreground_window())
+        if window_rect is not None:
+            center_x = (window_rect[0] + window_rect[2]) // 2
+            center_y = (window_rect[1] + window_rect[3]) // 2
+            for rect in monitors:
+                if rect_contains(rect, center_x, center_y):
+                    return rect
+        return monitors[0]
+
+    def bbox(self):
+        """Current rectangle being captured, or None for the primary monitor."""
+        if self.mode == "tracked-window":
+            rect = self.source.window_rect(self.window)
+            # Keep the last known position while the window is minimized or gone.
+            if rect is not None:
+                width, height = rect_size(self._bbox)
+                self._bbox = (rect[0], rect[1], rect[0] + width, rect[1] + height)
+        return self._bbox
+
+    def frame_size(self):
+        """(width, height) of the captured frames, or None for the primary monitor."""
+        if self._bbox is None:
+            return None
+        return rect_size(self._bbox)
+
+    def grab(self):
+        return self.source.grab(self.bbox())
+
+    def to_region(self, x, y):
+        """
+        Translate absolute screen coordinates into region-relative ones.
+
+        Returns (None, None) for points outside the captured frame, so an
+        action never points outside its own screenshot.
+        """
+        bbox = self.bbox() or self.source.monitors()[0]
+        if not rect_contains(bbox, x, y):
+            return None, None
+        return x - bbox[0], y - bbox[1]
+
+    def describe(self):
+        if self._bbox is None:
+            return "primary monitor"
+        return f"{self.mode} {self._bbox}"
+
+
+def create_capture_region(mode="full", monitor=None, source=None):
+    source = source or ScreenCaptureSource()
+    region = CaptureRegion(source, mode, monitor)
+    logging.info(f"Capture region: {region.describe()}")
+    return region
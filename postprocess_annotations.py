@@ -88,6 +88,8 @@ def post_process_actions(actions):
                     "button": None,
                     "x": None,
                     "y": None,
+                    "region_x": None,
+                    "region_y": None,
                     "n_scrolls": None,
                     "value": hotkey_keys,
                     "before_frame": hotkey_before_frame,
@@ -99,6 +101,8 @@ def post_process_actions(actions):
                     "button": None,
                     "x": None,
                     "y": None,
+                    "region_x": None,
+                    "region_y": None,
                     "n_scrolls": None,
                     "value": hotkey_keys,
                     "before_frame": hotkey_before_frame,
@@ -118,6 +122,8 @@ def post_process_actions(actions):
                     "button": current_action['button'],
                     "x": current_action['x'],
                     "y": current_action['y'],
+                    "region_x": current_action.get('region_x'),
+                    "region_y": current_action.get('region_y'),
                     "n_scrolls": None,
                     "value": [],
                     "before_frame": current_action['before_frame'],
@@ -135,6 +141,8 @@ def post_process_actions(actions):
                     "button": None,
                     "x": current_action['x'],
                     "y": current_action['y'],
+                    "region_x": next_action.get('region_x_start'),
+                    "region_y": next_action.get('region_y_start'),
                     "n_scrolls": None,
                     "value": [],
                     "before_frame": current_action['before_frame'],
@@ -147,6 +155,8 @@ def post_process_actions(actions):
                     "button": next_action['button'],
                     "x": next_action['x_end'],
                     "y": next_action['y_end'],
+                    "region_x": next_action.get('region_x_end'),
+                    "region_y": next_action.get('region_y_end'),
                     "n_scrolls": None,
                     "value": [],
                     "before_frame": new_drag_before,
@@ -179,6 +189,8 @@ def post_process_actions(actions):
                 "button": None,
                 "x": None,
                 "y": None,
+                "region_x": None,
+                "region_y": None,
                 "n_scrolls": merged_dy,
                 "value": [],
                 "before_frame": scroll_before_frame,
@@ -227,6 +239,8 @@ def post_process_actions(actions):
                     "button": None,
                     "x": None,
                     "y": None,
+                    "region_x": None,
+                    "region_y": None,
                     "n_scrolls": None,
                     "value": [typed_string],
                     "before_frame": typed_before_frame,
@@ -265,6 +279,8 @@ def merge_typewrite_actions(actions):
                 "button": None,
                 "x": None,
                 "y": None,
+                "region_x": None,
+                "region_y": None,
                 "n_scrolls": None,
                 "value": [merged_value],
                 "before_frame": first_before,
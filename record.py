@@ -10,7 +10,6 @@ from pathlib import Path
 import sys
 
 import numpy as np
-import pyautogui
 import pygetwindow as gw
 import win32gui
 import win32con
@@ -18,6 +17,7 @@ from pynput import mouse, keyboard
 
 from postprocess_annotations import post_process_actions, merge_typewrite_actions, delete_unused_images
 from postprocess_annotations import replace_all_before_frames
+from capture import REGION_MODES, create_capture_region
 
 import logging
 import string
@@ -44,12 +44,16 @@ recording_path = None
 
 is_mouse_pressed = False
 drag_start_position = (0, 0)
+drag_start_region = (0, 0)
 caps_lock_on = False
 
 start_time = time.time()
 
 executor = ThreadPoolExecutor(max_workers=4)
 
+# Part of the desktop that screenshots and the video are taken from.
+capture_region = None
+
 # Global variable that holds the latest captured screenshot (as a relative path)
 last_frame = None
 
@@ -58,14 +62,14 @@ def setup_directories():
     os.makedirs(images_dir, exist_ok=True)
 
 def create_recording_writer():
-    return cv2.VideoWriter(recording_path, codec, fps, resolution)
+    return cv2.VideoWriter(recording_path, codec, fps, capture_region.frame_size() or resolution)
 
 def take_screenshot(label):
     unique_id = uuid.uuid4().hex
     filename = f"{session_id}_{label}_{unique_id}.png"
     filepath = os.path.join(images_dir, filename)
     try:
-        img = pyautogui.screenshot()
+        img = capture_region.grab()
         img.save(filepath)
     except Exception as e:
         logging.error(f"Error taking screenshot: {e}")
@@ -99,15 +103,20 @@ def attach_screenshot(record, after_label, action_msg):
         logging.error(f"Screenshot error: {e}")
 
 def on_click(x, y, button, pressed):
-    global is_mouse_pressed, drag_start_position
+    global is_mouse_pressed, drag_start_position, drag_start_region
     if pressed:
         is_mouse_pressed = True
         drag_start_position = (x, y)
+        region_x, region_y = capture_region.to_region(x, y)
+        # Keep the region-relative start now, a tracked window may move before release.
+        drag_start_region = (region_x, region_y)
         record = {
             "action": "single_click",
             "button": str(button).split(".")[1],
             "x": x,
             "y": y,
+            "region_x": region_x,
+            "region_y": region_y,
             "n_scrolls": None,
             "value": [],
             "timestamp": time.time() - start_time,
@@ -118,6 +127,7 @@ def on_click(x, y, button, pressed):
     else:
         if is_mouse_pressed:
             if ((drag_start_position[0] - x)**2 + (drag_start_position[1] - y)**2)**0.5 > 5:
+                region_x_end, region_y_end = capture_region.to_region(x, y)
                 record = {
                     "action": "drag",
                     "button": str(button).split(".")[1],
@@ -125,6 +135,10 @@ def on_click(x, y, button, pressed):
                     "y_start": drag_start_position[1],
                     "x_end": x,
                     "y_end": y,
+                    "region_x_start": drag_start_region[0],
+                    "region_y_start": drag_start_region[1],
+                    "region_x_end": region_x_end,
+                    "region_y_end": region_y_end,
                     "timestamp": time.time() - start_time,
                     "before_frame": None,
                     "after_frame": None
@@ -192,6 +206,8 @@ def on_press_key(key):
                 "button": None,
                 "x": None,
                 "y": None,
+                "region_x": None,
+                "region_y": None,
                 "n_scrolls": None,
                 "value": [key_str],
                 "timestamp": time.time() - start_time,
@@ -217,7 +233,7 @@ def record_screen(out):
     while is_running:
         frame_start = time.time()
         try:
-            img = pyautogui.screenshot()
+            img = capture_region.grab()
             frame = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
             out.write(frame)
         except Exception as e:
@@ -241,10 +257,16 @@ def distance(a, b):
     return ((a[0] - b[0])**2 + (a[1] - b[1])**2)**0.5
 
 def main():
-    global session_id, base_dir, images_dir, annotations_file_path, recording_path, last_frame
+    global session_id, base_dir, images_dir, annotations_file_path, recording_path, last_frame, capture_region
     parser = argparse.ArgumentParser(description="Mouse and Keyboard Recording Program")
     parser.add_argument("--id", type=str, help="ID for folder naming and screenshot labeling", required=True)
+    parser.add_argument("--region", type=str, choices=REGION_MODES, default="full",
+                        help="Part of the desktop to capture: primary monitor, one monitor, or the active window (fixed or tracked)")
+    parser.add_argument("--monitor", type=int, default=None,
+                        help="Monitor index for --region monitor (default: the monitor containing the active window)")
     args = parser.parse_args()
+    if args.monitor is not None and args.region != "monitor":
+        parser.error("--monitor can only be used with --region monitor")
     session_id = args.id
     base_dir = os.path.join("data", session_id)
     images_dir = os.path.join(base_dir, "images")
@@ -257,6 +279,13 @@ def main():
     minimize_current_window()
     # Capture an initial screenshot to be used as the before_frame for the first action.
     time.sleep(1)
+    # Resolve the region after minimizing, so the active window is the task window.
+    try:
+        capture_region = create_capture_region(args.region, args.monitor)
+    except ValueError as e:
+        logging.error(f"Invalid capture region: {e}")
+        shutil.rmtree(base_dir, ignore_errors=True)
+        sys.exit(1)
     last_frame = take_screenshot("before")
     time.sleep(1)
     start_listeners()
@@ -0,0 +1,97 @@
+import pytest
+from PIL import Image
+
+from capture import CaptureRegion, ImageCaptureSource
+
+LEFT_MONITOR = (-1280, 0, 0, 1024)
+PRIMARY_MONITOR = (0, 0, 1920, 1080)
+
+
+def make_source(windows=None, foreground=None):
+    # Two monitors side by side, the secondary one left of the primary.
+    desktop = Image.new("RGB", (3200, 1080))
+    return ImageCaptureSource(desktop, origin=(-1280, 0),
+                              monitors=[PRIMARY_MONITOR, LEFT_MONITOR],
+                              windows=windows, foreground=foreground)
+
+
+def test_monitor_explicit_index():
+    region = CaptureRegion(make_source(), "monitor", 1)
+    assert region.bbox() == LEFT_MONITOR
+
+
+def test_monitor_defaults_to_active_window_monitor():
+    source = make_source(windows={"editor": (-1000, 100, -200, 700)}, foreground="editor")
+    assert CaptureRegion(source, "monitor").bbox() == LEFT_MONITOR
+
+
+def test_monitor_defaults_to_primary_without_active_window():
+    assert CaptureRegion(make_source(), "monitor").bbox() == PRIMARY_MONITOR
+
+
+def test_monitor_index_out_of_range():
+    with pytest.raises(ValueError, match="Monitor 2 not found"):
+        CaptureRegion(make_source(), "monitor", 2)
+
+
+@pytest.mark.parametrize("mode", ["window", "tracked-window"])
+def test_window_without_foreground_window(mode):
+    with pytest.raises(ValueError, match="No active window"):
+        CaptureRegion(make_source(), mode)
+
+
+def test_fixed_window_ignores_moves():
+    source = make_source(windows={"editor": (100, 200, 900, 800)}, foreground="editor")
+    region = CaptureRegion(source, "window")
+    source.windows["editor"] = (300, 250, 1200, 900)
+    assert region.bbox() == (100, 200, 900, 800)
+
+
+def test_tracked_window_follows_move_and_keeps_size():
+    source = make_source(windows={"editor": (100, 200, 900, 800)}, foreground="editor")
+    region = CaptureRegion(source, "tracked-window")
+    source.windows["editor"] = (-500, 50, 600, 900)
+    assert region.bbox() == (-500, 50, 300, 650)
+    assert region.frame_size() == (800, 600)
+    assert region.to_region(-400, 100) == (100, 50)
+    # A minimized or closed window keeps the last known position.
+    del source.windows["editor"]
+    assert region.bbox() == (-500, 50, 300, 650)
+
+
+@pytest.mark.parametrize("mode, monitor", [("monitor", 0), ("monitor", 1),
+                                           ("window", None), ("tracked-window", None)])
+def test_grab_matches_frame_size(mode, monitor):
+    source = make_source(windows={"editor": (-300, 100, 500, 700)}, foreground="editor")
+    region = CaptureRegion(source, mode, monitor)
+    assert region.grab().size == region.frame_size()
+
+
+def test_grab_crops_region_content():
+    desktop = Image.new("RGB", (3200, 1080))
+    desktop.putpixel((1280 + 150, 250), (255, 0, 0))
+    source = ImageCaptureSource(desktop, origin=(-1280, 0), monitors=[PRIMARY_MONITOR, LEFT_MONITOR],
+                                windows={"editor": (100, 200, 900, 800)}, foreground="editor")
+    region = CaptureRegion(source, "window")
+    x, y = region.to_region(150, 250)
+    assert (x, y) == (50, 50)
+    assert region.grab().getpixel((x, y)) == (255, 0, 0)
+
+
+def test_to_region_outside_region():
+    source = make_source(windows={"editor": (100, 200, 900, 800)}, foreground="editor")
+    region = CaptureRegion(source, "window")
+    assert region.to_region(100, 200) == (0, 0)
+    assert region.to_region(899, 799) == (799, 599)
+    assert region.to_region(900, 500) == (None, None)
+    assert region.to_region(-300, 500) == (None, None)
+
+
+def test_full_screen_is_unchanged():
+    region = CaptureRegion(make_source(), "full")
+    assert region.bbox() is None
+    assert region.frame_size() is None
+    assert region.to_region(20, 30) == (20, 30)
+    assert region.to_region(-20, 30) == (None, None)
+    # Like pyautogui on Windows, a full grab is the primary monitor only.
+    assert region.grab().size == (1920, 1080)
@@ -0,0 +1,57 @@
+from postprocess_annotations import post_process_actions
+
+
+def click(x, y, region, timestamp, frame):
+    return {
+        "action": "single_click",
+        "button": "left",
+        "x": x,
+        "y": y,
+        "region_x": region[0],
+        "region_y": region[1],
+        "n_scrolls": None,
+        "value": [],
+        "timestamp": timestamp,
+        "before_frame": None,
+        "after_frame": frame
+    }
+
+
+def test_double_click_keeps_region_coordinates():
+    actions = [
+        click(500, 400, (100, 50), 1.0, "s/images/s_after_a.png"),
+        click(501, 401, (101, 51), 1.5, "s/images/s_after_b.png"),
+    ]
+    [double_click] = post_process_actions(actions)
+    assert double_click["action"] == "double_click"
+    assert (double_click["region_x"], double_click["region_y"]) == (100, 50)
+
+
+def test_drag_split_uses_drag_region_coordinates(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    images_dir = tmp_path / "data" / "s" / "images"
+    images_dir.mkdir(parents=True)
+    (images_dir / "s_after_a.png").write_bytes(b"")
+    drag = {
+        "action": "drag",
+        "button": "left",
+        "x_start": 500,
+        "y_start": 400,
+        "x_end": 700,
+        "y_end": 450,
+        "region_x_start": 100,
+        "region_y_start": 50,
+        "region_x_end": 300,
+        "region_y_end": 100,
+        "timestamp": 2.0,
+        "before_frame": None,
+        "after_frame": "s/images/s_after_b.png"
+    }
+    # The click's region coordinates are ignored in favour of the drag's start.
+    actions = [click(500, 400, (0, 0), 1.0, "s/images/s_after_a.png"), drag]
+    move_to, drag_to = post_process_actions(actions)
+    assert move_to["action"] == "moveTo"
+    assert (move_to["region_x"], move_to["region_y"]) == (100, 50)
+    assert drag_to["action"] == "dragTo"
+    assert (drag_to["x"], drag_to["y"]) == (700, 450)
+    assert (drag_to["region_x"], drag_to["region_y"]) == (300, 100)